@@ -2,12 +2,39 @@ import logging
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.core import callback
-import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers import selector
 from .const import DOMAIN, ELECTRICITY_PRICE_SENSOR, POWER_SENSOR, ENERGY_SENSOR
 
 _LOGGER = logging.getLogger(__name__)
 
+# The form is static, so the schema is built once instead of on every render
+_USER_SCHEMA = vol.Schema({
+    vol.Required("electricity_price_sensor"): selector.EntitySelector(
+        selector.EntitySelectorConfig(domain="sensor", multiple=False)
+    ),
+    vol.Optional("power_sensor"): selector.EntitySelector(
+        selector.EntitySelectorConfig(domain="sensor", multiple=False, device_class="power")
+    ),
+    vol.Optional("energy_sensor"): selector.EntitySelector(
+        selector.EntitySelectorConfig(domain="sensor", multiple=False, device_class="energy")
+    )
+})
+
+# Error keys raised by _exactly_one_sensor, shown as is in the form
+_SENSOR_ERRORS = ("missing_sensor", "invalid_config")
+
+def _exactly_one_sensor(user_input):
+    """Validate that either a power sensor or an energy sensor is provided, not both."""
+    if not user_input.get("power_sensor") and not user_input.get("energy_sensor"):
+        _LOGGER.warning("Neither power nor energy sensor was provided.")
+        raise vol.Invalid("missing_sensor")
+    if user_input.get("power_sensor") and user_input.get("energy_sensor"):
+        _LOGGER.warning("Both power and energy sensors were provided.")
+        raise vol.Invalid("invalid_config")
+    return user_input
+
+_CONFIG_SCHEMA = vol.All(_USER_SCHEMA, _exactly_one_sensor)
+
 class DynamicEnergyCostConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Dynamic Energy Cost."""
     VERSION = 1
@@ -21,20 +48,8 @@ class DynamicEnergyCostConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             _LOGGER.info("Received user input: %s", user_input)
             try:
-                # Validate the electricity price sensor
-                cv.entity_id(user_input["electricity_price_sensor"])
-                if user_input.get("power_sensor"):
-                    cv.entity_id(user_input["power_sensor"])
-                if user_input.get("energy_sensor"):
-                    cv.entity_id(user_input["energy_sensor"])
-                
-                # Check that either power sensor or energy sensor is filled
-                if not user_input.get("power_sensor") and not user_input.get("energy_sensor"):
-                    _LOGGER.warning("Neither power nor energy sensor was provided.")
-                    raise exceptions.Invalid("Please enter either a power sensor or an energy sensor, not both.")
-                if user_input.get("power_sensor") and user_input.get("energy_sensor"):
-                    _LOGGER.warning("Both power and energy sensors were provided.")
-                    raise exceptions.Invalid("Please enter only one type of sensor (power or energy).")
+                # Validate the entities and that exactly one of power sensor or energy sensor is filled
+                user_input = _CONFIG_SCHEMA(user_input)
 
                 # Create the config dictionary
                 config = {
@@ -46,23 +61,11 @@ class DynamicEnergyCostConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title="Dynamic Energy Cost", data=config)
             except vol.Invalid as err:
                 _LOGGER.error("Validation error: %s", err)
-                errors["base"] = "invalid_entity"
-
-        schema = vol.Schema({
-            vol.Required("electricity_price_sensor"): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", multiple=False)
-            ),
-            vol.Optional("power_sensor"): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", multiple=False, device_class="power")
-            ),
-            vol.Optional("energy_sensor"): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", multiple=False, device_class="energy")
-            )
-        })
+                errors["base"] = err.error_message if err.error_message in _SENSOR_ERRORS else "invalid_entity"
 
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
             description_placeholders={
                 "electricity_price_sensor": "Electricity Price Sensor",
@@ -28,32 +28,32 @@ class BaseEnergyCostSensor(RestoreEntity, SensorEntity):
         self.schedule_next_reset()
         _LOGGER.debug("Sensor initialized with energy sensor ID %s and price sensor ID %s.", energy_sensor_id, price_sensor_id)
 
-        _LOGGER.debug(f"Initializing EnergyCostSensor with energy_sensor_id: {energy_sensor_id} and price_sensor_id: {price_sensor_id}")
+        _LOGGER.debug("Initializing EnergyCostSensor with energy_sensor_id: %s and price_sensor_id: %s", energy_sensor_id, price_sensor_id)
 
         # Generate friendly names based on the energy sensor's ID
         base_part = energy_sensor_id.split('.')[-1]
-        _LOGGER.debug(f"Base part extracted from energy_sensor_id: {base_part}")
+        _LOGGER.debug("Base part extracted from energy_sensor_id: %s", base_part)
 
         friendly_name_parts = base_part.replace('_', ' ').split()
-        _LOGGER.debug(f"Parts after replacing underscores and splitting: {friendly_name_parts}")
+        _LOGGER.debug("Parts after replacing underscores and splitting: %s", friendly_name_parts)
 
         # Exclude words that are commonly not part of the main identifier
         friendly_name_parts = [word for word in friendly_name_parts if word.lower() != 'energy']
-        _LOGGER.debug(f"Parts after removing 'energy': {friendly_name_parts}")
+        _LOGGER.debug("Parts after removing 'energy': %s", friendly_name_parts)
 
         friendly_name = ' '.join(friendly_name_parts).title()
-        _LOGGER.debug(f"Final friendly name generated: {friendly_name}")
+        _LOGGER.debug("Final friendly name generated: %s", friendly_name)
 
         self._base_name = friendly_name
         self._device_name = friendly_name + ' Dynamic Energy Cost'
 
-        _LOGGER.debug(f"Sensor base name set to: {self._base_name}")
-        _LOGGER.debug(f"Sensor device name set to: {self._device_name}")
+        _LOGGER.debug("Sensor base name set to: %s", self._base_name)
+        _LOGGER.debug("Sensor device name set to: %s", self._device_name)
 
     @callback
     def async_reset(self):
         """Reset the energy cost and cumulative energy kWh."""
-        _LOGGER.debug(f"Resetting cost for {self.entity_id}")
+        _LOGGER.debug("Resetting cost for %s", self.entity_id)
         self._state = 0
         self._cumulative_energy = 0
         self._cumulative_cost = 0
@@ -135,10 +135,10 @@ class BaseEnergyCostSensor(RestoreEntity, SensorEntity):
             currency = price_entity.attributes['unit_of_measurement'].split('/')[0].strip()
             if (currency == '€'):
                 currency = 'EUR'
-            _LOGGER.debug(f"Extracted currency '{currency}' from unit of measurement '{price_entity.attributes['unit_of_measurement']}'.")
+            _LOGGER.debug("Extracted currency '%s' from unit of measurement '%s'.", currency, price_entity.attributes['unit_of_measurement'])
             return currency
         else:
-            _LOGGER.warning(f"Unit of measurement not available or invalid for sensor {self._price_sensor_id}, defaulting to 'EUR'.")
+            _LOGGER.warning("Unit of measurement not available or invalid for sensor %s, defaulting to 'EUR'.", self._price_sensor_id)
         return 'EUR'  # Default to EUR if not found
 
     # -----------------------------------------------------------------------------------------------
@@ -148,8 +148,8 @@ class BaseEnergyCostSensor(RestoreEntity, SensorEntity):
         if self._interval == "daily":
             next_reset = current_time.replace(hour=0, minute=0, second=1, microsecond=0) + timedelta(days=1)
         elif self._interval == "monthly":
-            next_month = (current_time.replace(day=1) + timedelta(days=32)).replace(day=1)
-            next_reset = next_month.replace(hour=0, minute=0, second=1, microsecond=0)
+            year, month = current_time.year + current_time.month // 12, current_time.month % 12 + 1
+            next_reset = current_time.replace(year=year, month=month, day=1, hour=0, minute=0, second=1, microsecond=0)
         elif self._interval == "yearly":
             next_reset = current_time.replace(year=current_time.year + 1, month=1, day=1, hour=0, minute=0, second=1, microsecond=0)
         return next_reset
@@ -167,7 +167,7 @@ class BaseEnergyCostSensor(RestoreEntity, SensorEntity):
         self._last_energy_reading = None
         self.async_write_ha_state() # Update the state in Home Assistant
         self.schedule_next_reset() # Reschedule the next reset
-        _LOGGER.debug(f"Meter reset for {self.name} and cumulative energy reset to {self._cumulative_energy}. Next reset scheduled.")
+        _LOGGER.debug("Meter reset for %s and cumulative energy reset to %s. Next reset scheduled.", self.name, self._cumulative_energy)
 
     # -----------------------------------------------------------------------------------------------
     # when there is a price change we need to calculate the consumed energy used since last reading for the old price
@@ -188,7 +188,7 @@ class BaseEnergyCostSensor(RestoreEntity, SensorEntity):
                 energy_difference = current_energy - self._last_energy_reading
                 cost_increment = energy_difference * price
                 self._cumulative_cost += cost_increment
-                _LOGGER.info(f"Energy cost synchronized from {self._state} EUR to {self._cumulative_cost} EUR")
+                _LOGGER.info("Energy cost synchronized from %s EUR to %s EUR", self._state, self._cumulative_cost)
                 self._state = self._cumulative_cost
                 self._cumulative_energy += energy_difference  # Add to the running total of energy
 
@@ -199,7 +199,7 @@ class BaseEnergyCostSensor(RestoreEntity, SensorEntity):
             self.async_write_ha_state()
 
         except Exception as e:
-            _LOGGER.error(f"Failed to update energy costs due to an error: {e}", exc_info=True)
+            _LOGGER.error("Failed to update energy costs due to an error: %s", e, exc_info=True)
         pass
 
     # -----------------------------------------------------------------------------------------------
@@ -225,12 +225,12 @@ class BaseEnergyCostSensor(RestoreEntity, SensorEntity):
             energy_difference = current_energy - self._last_energy_reading
             cost_increment = energy_difference * price
             self._state = self._cumulative_cost + cost_increment        # set state to the cumulative cost + increment since last energy reading
-            _LOGGER.info(f"Energy cost incremented by {cost_increment} EUR, total cost now {self._state} EUR")
+            _LOGGER.info("Energy cost incremented by %s EUR, total cost now %s EUR", cost_increment, self._state)
                 
             self.async_write_ha_state()
 
         except Exception as e:
-            _LOGGER.error(f"Failed to update energy costs due to an error: {e}", exc_info=True)
+            _LOGGER.error("Failed to update energy costs due to an error: %s", e, exc_info=True)
         pass
 
 # Define sensor classes for each interval
@@ -1,36 +1,64 @@
 import logging
-from decimal import Decimal
+import math
+from decimal import Decimal, InvalidOperation
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval, async_track_point_in_time
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event, async_track_time_interval, async_track_point_in_time
 from homeassistant.util.dt import now
 from datetime import timedelta
 from .const import DOMAIN, ELECTRICITY_PRICE_SENSOR, ENERGY_SENSOR, POWER_SENSOR, SERVICE_RESET_COST
 _LOGGER = logging.getLogger(__name__)
 
+REAL_TIME_UPDATE_DELAY = 0.5   # seconds to coalesce bursts of sensor updates into a single write
+MICRO_EUR = 1_000_000          # utility meters accumulate the cost in integer micro-EUR
+_INVALID_STATES = frozenset({'unknown', 'unavailable', '', None})   # states without a usable value
+
+def _try_float(value):
+    """Convert a sensor state to float, returns None if it is not numeric or not finite."""
+    try:
+        result = float(value)
+    except ValueError as e:
+        _LOGGER.error("Error converting sensor data to float: %s", e)
+        return None
+    if not math.isfinite(result):
+        _LOGGER.error("Sensor data is not a finite number: %s", value)
+        return None
+    return result
+
 class RealTimeCostSensor(SensorEntity):
     """Sensor that calculates energy cost in real-time based on power usage and electricity price."""
 
+    # The Entity base classes still provide a __dict__, slots only speed up and shrink our own attributes
+    __slots__ = (
+        "hass", "_config_entry", "_electricity_price_sensor_id", "_power_sensor_id", "_state",
+        "_last_price", "_last_power", "_pending", "_utility_sensors",
+        "_friendly_name", "_base_name", "_device_name",
+    )
+
     def __init__(self, hass, config_entry, electricity_price_sensor_id, power_sensor_id, name):
         """Initialize the sensor."""
         self.hass = hass
         self._config_entry = config_entry
         self._electricity_price_sensor_id = electricity_price_sensor_id
         self._power_sensor_id = power_sensor_id
-        self._state = Decimal(0)
+        self._state = 0.0
+        self._last_price = None     # last known electricity price, kept in sync by handle_state_change
+        self._last_power = None     # last known power usage, kept in sync by handle_state_change
+        self._pending = None        # cancel callback of the scheduled _flush, if any
+        self._utility_sensors = []  # utility meters receiving the updates of this sensor
 
-        _LOGGER.debug(f"Initialized Real Time Cost Sensor with price sensor: {electricity_price_sensor_id} and power sensor: {power_sensor_id}")
+        _LOGGER.debug("Initialized Real Time Cost Sensor with price sensor: %s and power sensor: %s", electricity_price_sensor_id, power_sensor_id)
 
         # Extract a friendly name from the power sensor's entity ID
         base_part = power_sensor_id.split('.')[-1]  # Assuming entity_id format like 'sensor.heat_pump_power'
         friendly_name_parts = base_part.replace('_', ' ').split()  # Split into words
         friendly_name_parts = [word for word in friendly_name_parts if word.lower() != 'power']  # Remove the word "Power"
-        friendly_name = ' '.join(friendly_name_parts).title()  # Rejoin and title-case
-        self._base_name = friendly_name + ' Real Time Energy Cost'
+        self._friendly_name = ' '.join(friendly_name_parts).title()  # Rejoin and title-case, reused by the utility meters
+        self._base_name = self._friendly_name + ' Real Time Energy Cost'
 
         # Prepare a device name using the friendly base part
-        self._device_name = friendly_name + ' Dynamic Energy Cost'
+        self._device_name = self._friendly_name + ' Dynamic Energy Cost'
 
     @property
     def unique_id(self):
@@ -54,7 +82,7 @@ class RealTimeCostSensor(SensorEntity):
     @property
     def state(self):
         """Return the current state of the sensor."""
-        return float(self._state)
+        return self._state
 
     @property
     def unit_of_measurement(self):
@@ -62,40 +90,123 @@ class RealTimeCostSensor(SensorEntity):
         return 'EUR/h'
 
 
+    def _read_sensor_value(self, entity_id):
+        """Return the value of a sensor from the state machine, or None if it is unavailable."""
+        state = self.hass.states.get(entity_id)
+        if state is None or state.state in _INVALID_STATES:
+            return None
+        return _try_float(state.state)
+
     @callback
     def handle_state_change(self, event):
         """Handle changes to the electricity price or power usage."""
         entity_id = event.data['entity_id']
         new_state = event.data.get('new_state')
-
-        if new_state is None or new_state.state in ['unknown', 'unavailable']:
-            _LOGGER.warning(f"State of {entity_id} is '{new_state.state}', skipping update.")
+        price_sensor_id = self._electricity_price_sensor_id
+        power_sensor_id = self._power_sensor_id
+        is_price = entity_id == price_sensor_id
+
+        if new_state is None or new_state.state in _INVALID_STATES:
+            _LOGGER.warning("State of %s is '%s', skipping update.", entity_id, new_state.state if new_state else None)
+            value = None
+        else:
+            # Re-reports of the same value (e.g. attribute changes) need no recalculation once the value is cached
+            old_state = event.data.get('old_state')
+            cached_value = self._last_price if is_price else self._last_power
+            if cached_value is not None and old_state is not None and old_state.state == new_state.state:
+                return
+            value = _try_float(new_state.state)
+
+        if value is None:
+            # Forget the cached value, it is read again from the state machine once the sensor is back
+            if is_price:
+                self._last_price = None
+            else:
+                self._last_power = None
             return
 
-        electricity_price = self.hass.states.get(self._electricity_price_sensor_id).state
-        power_usage = self.hass.states.get(self._power_sensor_id).state
+        # The sensor that fired is taken from the event, the other one from cache or the state machine
+        if is_price:
+            electricity_price = value
+            power_usage = self._last_power
+            if power_usage is None:
+                power_usage = self._read_sensor_value(power_sensor_id)
+        else:
+            power_usage = value
+            electricity_price = self._last_price
+            if electricity_price is None:
+                electricity_price = self._read_sensor_value(price_sensor_id)
+
+        if electricity_price == self._last_price and power_usage == self._last_power:
+            return
+        self._last_price = electricity_price
+        self._last_power = power_usage
 
-        if not electricity_price or not power_usage or electricity_price in ['unknown', 'unavailable'] or power_usage in ['unknown', 'unavailable']:
+        if electricity_price is None or power_usage is None:
             _LOGGER.warning("One or more sensor values are unavailable, skipping update.")
             return
 
-        try:
-            electricity_price = float(electricity_price)
-            power_usage = float(power_usage)
-            calculated_cost = round(electricity_price * (power_usage / 1000), 2)
-            if calculated_cost != self._state:
-                self._state = Decimal(calculated_cost)
-                self.async_write_ha_state()
-                _LOGGER.debug(f"Updated Real Time Energy Cost: {calculated_cost} EUR/h")
-        except ValueError as e:
-            _LOGGER.error(f"Error converting sensor data to float: {e}")
+        # Coalesce bursts of updates, the cost is calculated once the delay has passed
+        if self._pending is None:
+            self._pending = async_call_later(self.hass, REAL_TIME_UPDATE_DELAY, self._flush)
+
+    @callback
+    def _flush(self, _):
+        """Calculate the real-time cost from the last known sensor values, called by async_call_later."""
+        self._pending = None
+        if self._last_price is None or self._last_power is None:
+            return
+
+        calculated_cost = round(self._last_price * (self._last_power / 1000), 2)
+        if calculated_cost != self._state:
+            self._state = calculated_cost
+            self.async_write_ha_state()
+            _LOGGER.debug("Updated Real Time Energy Cost: %s EUR/h", calculated_cost)
+
+    @callback
+    def async_register_utility_sensor(self, utility_sensor):
+        """Register a utility meter to receive the updates of this sensor, returns a callback to unregister."""
+        self._utility_sensors.append(utility_sensor)
+
+        @callback
+        def unregister():
+            self._utility_sensors.remove(utility_sensor)
+
+        return unregister
+
+    @callback
+    def _dispatch_cost_update(self, event):
+        """Forward a state change of this sensor to all registered utility meters."""
+        new_state = event.data.get('new_state')
+        if new_state is None or new_state.state in _INVALID_STATES:
+            _LOGGER.debug("Skipping update due to unavailable state")
+            return
+
+        current_cost = _try_float(new_state.state)
+        if current_cost is None:
+            return
+
+        # Parse and read the clock once for all meters, then only write the meters whose reported cost changed
+        current_time = now()
+        changed = [utility_sensor for utility_sensor in self._utility_sensors if utility_sensor._apply_update(current_cost, current_time)]
+        for utility_sensor in changed:
+            utility_sensor.async_write_ha_state()
 
     async def async_added_to_hass(self):
         """Register callbacks when added to hass."""
-        async_track_state_change_event(
+        self.async_on_remove(async_track_state_change_event(
             self.hass, [self._electricity_price_sensor_id, self._power_sensor_id], self.handle_state_change
-        )
-        _LOGGER.info(f"Callbacks registered for {self._electricity_price_sensor_id} and {self._power_sensor_id}")
+        ))
+        _LOGGER.info("Callbacks registered for %s and %s", self._electricity_price_sensor_id, self._power_sensor_id)
+        # A single listener on this sensor shared by all its utility meters
+        self.async_on_remove(async_track_state_change_event(self.hass, [self.entity_id], self._dispatch_cost_update))
+
+    async def async_will_remove_from_hass(self):
+        """Cancel a pending update when removed from hass."""
+        await super().async_will_remove_from_hass()
+        if self._pending is not None:
+            self._pending()
+            self._pending = None
 
 def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the sensor platform from a config entry."""
@@ -112,53 +223,63 @@ def async_setup_entry(hass, config_entry, async_add_entities):
 class UtilityMeterSensor(SensorEntity, RestoreEntity):
     """Sensor that calculates cumulative energy costs over set intervals and resets accordingly."""
 
+    __slots__ = ("hass", "_real_time_cost_sensor", "_interval", "_state_micro", "_last_update", "_reset_timer", "_name")
+
     def __init__(self, hass, real_time_cost_sensor, interval):
         """Initialize the sensor."""
         super().__init__()
         self.hass = hass
         self._real_time_cost_sensor = real_time_cost_sensor
         self._interval = interval
-        self._state = Decimal('0.00')
+        self._state_micro = 0    # cumulative cost in micro-EUR, integer math keeps it exact
         self._last_update = now()
-        base_name = real_time_cost_sensor.name.replace(" Real Time Energy Cost", "").strip()
-        self._name = f"{base_name} {interval.title()} Energy Cost"
+        self._reset_timer = None    # cancel callback of the scheduled reset
+        self._name = f"{real_time_cost_sensor._friendly_name} {interval.title()} Energy Cost"
 
     async def async_added_to_hass(self):
         """Restore state and set up updates when added to Home Assistant."""
         await super().async_added_to_hass()
         # Restore state if available
         last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in ('unknown', 'unavailable'):
+        if last_state and last_state.state not in _INVALID_STATES:
             try:
-                self._state = Decimal(last_state.state)
+                restored_state = Decimal(last_state.state)
             except InvalidOperation:
+                restored_state = None
+            if restored_state is not None and restored_state.is_finite():
+                self._state_micro = int(restored_state * MICRO_EUR)
+            else:
                 _LOGGER.error("Invalid state value for restoration: %s", last_state.state)
         self.schedule_next_reset()
-        _LOGGER.debug("Registering state change event for: %s", self._real_time_cost_sensor.entity_id)
-        try:
-            async_track_state_change_event(self.hass, [self._real_time_cost_sensor.entity_id], self._handle_real_time_cost_update)
-        except Exception as e:
-            _LOGGER.error("Failed to track state change: %s", str(e))
+        _LOGGER.debug("Registering for updates of: %s", self._real_time_cost_sensor.entity_id)
+        self.async_on_remove(self._real_time_cost_sensor.async_register_utility_sensor(self))
+
+    async def async_will_remove_from_hass(self):
+        """Cancel the scheduled reset when removed from hass."""
+        await super().async_will_remove_from_hass()
+        if self._reset_timer is not None:
+            self._reset_timer()
+            self._reset_timer = None
 
     def calculate_next_reset_time(self):
         """Determine the exact datetime for the next reset based on the interval."""
-        current_time = now()
+        current_time = now()     # single clock read, all branches derive the reset from it
         if self._interval == "daily":
             next_reset = (current_time + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
         elif self._interval == "monthly":
-            next_month = (current_time.replace(day=1) + timedelta(days=32)).replace(day=1)
-            next_reset = next_month.replace(hour=0, minute=0, second=0, microsecond=0)
+            year, month = current_time.year + current_time.month // 12, current_time.month % 12 + 1
+            next_reset = current_time.replace(year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
         elif self._interval == "yearly":
             next_reset = current_time.replace(year=current_time.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
         
-        _LOGGER.debug(f"Calculated next reset time for {self._interval} reset: {next_reset}")
+        _LOGGER.debug("Calculated next reset time for %s reset: %s", self._interval, next_reset)
         return next_reset
 
     @callback
     def async_reset(self):
         """Reset the energy cost and cumulative energy kWh."""
-        _LOGGER.debug(f"Resetting cost for {self.entity_id}")
-        self._state = 0
+        _LOGGER.debug("Resetting cost for %s", self.entity_id)
+        self._state_micro = 0
         self.async_write_ha_state()
 
     @callback
@@ -167,11 +288,12 @@ class UtilityMeterSensor(SensorEntity, RestoreEntity):
         next_reset_time = self.calculate_next_reset_time()
 
         # Cancel existing scheduled reset if it exists
-        if hasattr(self, '_reset_timer'):
-            self.hass.async_create_task(self.hass.async_remove_job(self._reset_timer))
+        if self._reset_timer is not None:
+            self._reset_timer()
+            self._reset_timer = None
 
         # Log the scheduling of the next reset
-        _LOGGER.debug(f"Scheduling next reset for {self._name} at {next_reset_time}")
+        _LOGGER.debug("Scheduling next reset for %s at %s", self._name, next_reset_time)
 
         # Schedule the next reset
         self._reset_timer = async_track_point_in_time(self.hass, self._reset_meter, next_reset_time)
@@ -179,34 +301,31 @@ class UtilityMeterSensor(SensorEntity, RestoreEntity):
 
     async def _reset_meter(self, _):
         """Reset the meter at the specified interval."""
-        self._state = Decimal('0.00')
+        self._state_micro = 0
         self._last_update = now()
         self.async_write_ha_state()
         self.schedule_next_reset()
-        _LOGGER.debug(f"Meter reset for {self._name}. Next reset scheduled.")
+        _LOGGER.debug("Meter reset for %s. Next reset scheduled.", self._name)
 
     @callback
-    def _handle_real_time_cost_update(self, event):
-        """Update cumulative cost based on the real-time cost sensor updates."""
-        new_state = event.data.get('new_state')
-        if new_state is None or new_state.state in ('unknown', 'unavailable'):
-            _LOGGER.debug("Skipping update due to unavailable state")
-            return
+    def _apply_update(self, current_cost, current_time):
+        """Add the real-time cost since the last update, returns True when the reported state changed. Called by RealTimeCostSensor."""
+        time_difference = current_time - self._last_update
+        hours_passed = time_difference.total_seconds() / 3600  # Convert time difference to hours
 
-        try:
-            current_cost = Decimal(new_state.state)
-            _LOGGER.debug(f"Current cost retrieved from state: {current_cost}")  # Log current cost
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Current cost retrieved from state: %s", current_cost)  # Log current cost
+            _LOGGER.debug("Time difference calculated as: %s, which is %s hours.", time_difference, hours_passed)  # Log time difference in hours
 
-            time_difference = now() - self._last_update
-            hours_passed = Decimal(time_difference.total_seconds()) / Decimal(3600)  # Convert time difference to hours as Decimal
-            _LOGGER.debug(f"Time difference calculated as: {time_difference}, which is {hours_passed} hours.")  # Log time difference in hours
+        reported_state = round(self._state_micro, -4)   # rounded to cents, as reported by state
+        self._state_micro += round(current_cost * hours_passed * MICRO_EUR)
+        self._last_update = current_time
 
-            self._state += (current_cost * hours_passed).quantize(Decimal('0.01'))
-            self._last_update = now()
-            self.async_write_ha_state()
-            _LOGGER.debug(f"Updated state to: {self._state} using cost: {current_cost} over {hours_passed} hours")
-        except (InvalidOperation, TypeError) as e:
-            _LOGGER.error(f"Error updating cumulative cost: {e}")
+        # Only report a change when the reported (rounded) cost changes, smaller increments stay in the accumulator
+        if round(self._state_micro, -4) == reported_state:
+            return False
+        _LOGGER.debug("Updated state to: %s using cost: %s over %s hours", self.state, current_cost, hours_passed)
+        return True
 
     @property
     def unique_id(self):
@@ -226,7 +345,7 @@ class UtilityMeterSensor(SensorEntity, RestoreEntity):
     @property
     def state(self):
         """Return the current cumulative cost."""
-        return self._state
+        return round(self._state_micro, -4) / MICRO_EUR
 
     @property
     def unit_of_measurement(self):